@@ -10,9 +10,14 @@ This script generates all necessary brand assets for the InsightWave application
 
 Features:
 - Automatic dependency installation
+- Fast native rasterization via resvg-py when installed (cairosvg otherwise)
 - High-quality vector and raster assets
 - Complete PWA icon set
 - Comprehensive favicon package for cross-platform support
+- Content-addressed asset cache for fast rebuilds (disable with --no-cache)
+- Quiet mode without progress output for CI (--quiet or ASSETS_QUIET=1)
+- Single rasterization per icon set; --pixel-perfect renders every size from the vector
+- Templated SVG output; --svgwrite builds the logo and app icon through svgwrite instead
 
 Author: Advanced Frontend Engineer
 Date: 2025-03-25
@@ -23,11 +28,20 @@ import sys
 import subprocess
 import shutil
 import json
+import io
 import tempfile
 import time
+import re
+import hashlib
+import functools
+import importlib.util
+import importlib.metadata
 from pathlib import Path
-from typing import Dict, List, Tuple, Union, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, NamedTuple, Tuple, Union, Optional
 import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Define project paths
 PROJECT_ROOT = Path(os.path.abspath(os.path.dirname(__file__)))
@@ -35,6 +49,15 @@ ASSETS_DIR = PROJECT_ROOT / "assets"
 ICONS_DIR = ASSETS_DIR / "icons"
 IMAGES_DIR = ASSETS_DIR / "images"
 
+# Command-line switches
+USE_CACHE = "--no-cache" not in sys.argv
+QUIET = "--quiet" in sys.argv or bool(os.environ.get("ASSETS_QUIET"))
+PIXEL_PERFECT = "--pixel-perfect" in sys.argv
+USE_SVGWRITE = "--svgwrite" in sys.argv
+
+# Records the interpreter that last passed the dependency check for this script version
+DEPS_MARKER = PROJECT_ROOT / ".cache" / "deps.ok"
+
 # Create directories if they don't exist
 for directory in [ASSETS_DIR, ICONS_DIR, IMAGES_DIR]:
     directory.mkdir(exist_ok=True, parents=True)
@@ -54,62 +77,73 @@ class BrandColors:
     
     @classmethod
     def get_gradient_stops(cls, count: int) -> List[str]:
-        """Generate gradient color stops between start and end colors."""
+        """Generate gradient color stops between start and end colors (vectorized with NumPy)."""
         def hex_to_rgb(hex_color: str) -> Tuple[float, float, float]:
             hex_color = hex_color.lstrip('#')
             return tuple(int(hex_color[i:i+2], 16) / 255 for i in (0, 2, 4))
         
-        def rgb_to_hex(rgb: Tuple[float, float, float]) -> str:
-            return '#{:02x}{:02x}{:02x}'.format(
-                int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+        start_rgb = np.array(hex_to_rgb(cls.GRADIENT_START))
+        end_rgb = np.array(hex_to_rgb(cls.GRADIENT_END))
         
-        start_rgb = hex_to_rgb(cls.GRADIENT_START)
-        end_rgb = hex_to_rgb(cls.GRADIENT_END)
+        # Interpolate all stops and channels at once
+        t = np.arange(count)[:, None] / (count - 1) if count > 1 else np.zeros((count, 1))
+        rgb = start_rgb + (end_rgb - start_rgb) * t
         
-        gradient = []
-        for i in range(count):
-            t = i / (count - 1) if count > 1 else 0
-            rgb = tuple(start + (end - start) * t for start, end in zip(start_rgb, end_rgb))
-            gradient.append(rgb_to_hex(rgb))
-        
-        return gradient
+        # Hex-encode the packed RGB bytes in one go, 6 digits per stop
+        packed = (rgb * 255).astype(np.uint8).tobytes().hex()
+        return ['#' + packed[i:i+6] for i in range(0, len(packed), 6)]
 
 # Check and install dependencies
 def install_dependencies():
     """Install required Python packages if they're not already installed."""
+    # (pip package, import name) pairs
     required_packages = [
-        "pillow",
-        "cairosvg",
-        "svgwrite",
-        "numpy",
-        "click",
-        "rich",
+        ("pillow", "PIL"),
+        ("cairosvg", "cairosvg"),
+        ("svgwrite", "svgwrite"),
+        ("numpy", "numpy"),
+        ("click", "click"),
+        ("rich", "rich"),
+    ]
+    
+    # Optional accelerators: installed when possible, never required
+    optional_packages = [
+        ("resvg-py", "resvg_py"),
     ]
     
+    # Skip the check on warm runs of the same interpreter; editing this script invalidates the marker
+    try:
+        if (DEPS_MARKER.stat().st_mtime > Path(__file__).stat().st_mtime and 
+                DEPS_MARKER.read_text(encoding="utf-8") == sys.executable):
+            return
+    except FileNotFoundError:
+        pass
+    
     # Check if we're in a virtual environment
     in_venv = sys.prefix != sys.base_prefix
     pip_command = [sys.executable, "-m", "pip", "install"]
     
-    try:
-        from rich.console import Console
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-        fancy_output = True
-    except ImportError:
+    if QUIET:
         fancy_output = False
-        print("Installing dependencies...")
+    else:
+        try:
+            from rich.console import Console
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            fancy_output = True
+        except ImportError:
+            fancy_output = False
+            print("Installing dependencies...")
         
     if fancy_output:
         console = Console()
         console.print("[bold blue]InsightWave Asset Generator[/bold blue]")
         console.print("Checking dependencies...", style="dim")
     
-    # Check installed packages
-    try:
-        import pkg_resources
-        installed_packages = {pkg.key for pkg in pkg_resources.working_set}
-        missing = [pkg for pkg in required_packages if pkg.lower() not in installed_packages]
-    except ImportError:
-        missing = required_packages
+    # Check installed packages by locating their modules, without importing them
+    missing = [package for package, module in required_packages 
+               if importlib.util.find_spec(module) is None]
+    missing_optional = [package for package, module in optional_packages 
+                        if importlib.util.find_spec(module) is None]
     
     if missing:
         if fancy_output:
@@ -131,8 +165,22 @@ def install_dependencies():
     else:
         if fancy_output:
             console.print("✓ All dependencies already installed", style="green")
-        else:
+        elif not QUIET:
             print("All dependencies already installed.")
+    
+    # A failure here (e.g. no wheel for this platform) just keeps the fallback
+    if missing_optional:
+        result = subprocess.call(pip_command + missing_optional, 
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+        if result == 0:
+            importlib.invalidate_caches()
+        if fancy_output:
+            status = "installed" if result == 0 else "unavailable, using fallback"
+            console.print(f"  Optional {', '.join(missing_optional)}: {status}", style="dim")
+    
+    DEPS_MARKER.parent.mkdir(exist_ok=True, parents=True)
+    DEPS_MARKER.write_text(sys.executable, encoding="utf-8")
 
 # Install dependencies
 install_dependencies()
@@ -141,11 +189,165 @@ install_dependencies()
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageChops
 import svgwrite
-import cairosvg
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-console = Console()
+class _NoopProgress:
+    """Stand-in for rich.progress.Progress that displays nothing"""
+    
+    def __init__(self, *columns, **kwargs):
+        pass
+    
+    def __enter__(self) -> "_NoopProgress":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        pass
+    
+    def add_task(self, description: str, total: Optional[float] = None, **fields) -> int:
+        return 0
+    
+    def update(self, task_id: int, **kwargs) -> None:
+        pass
+
+class _NoopConsole:
+    """Stand-in for rich.console.Console that discards all output"""
+    
+    def print(self, *objects, **kwargs) -> None:
+        pass
+
+def _noop_column(*args, **kwargs) -> None:
+    """Stand-in for rich progress columns"""
+    return None
+
+# rich is only imported when its output will actually be shown
+if QUIET:
+    Progress = _NoopProgress
+    SpinnerColumn = TextColumn = _noop_column
+    console = _NoopConsole()
+else:
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    console = Console()
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write a file unless it already holds exactly these bytes"""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+# Content-addressed cache for generated assets
+CACHE_DIR = PROJECT_ROOT / ".cache" / "assets"
+
+# Any edit to this script may change the SVG output, so it is part of every icon key
+GENERATOR_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+def cached_asset(key_func: Callable[..., Tuple[bytes, Path]]) -> Callable:
+    """Serve a generated file from the cache when its inputs are unchanged.
+    
+    ``key_func`` receives the wrapped function's arguments and returns the
+    bytes that determine the output together with the output path.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not USE_CACHE:
+                return func(*args, **kwargs)
+            
+            key_data, output_path = key_func(*args, **kwargs)
+            digest = hashlib.sha256(key_data).hexdigest()
+            cached_path = CACHE_DIR / f"{digest}{output_path.suffix}"
+            
+            # Cache hit: copy instead of regenerating
+            if cached_path.exists():
+                _write_if_changed(output_path, cached_path.read_bytes())
+                return None
+            
+            result = func(*args, **kwargs)
+            
+            # Populate atomically, several workers may produce the same key
+            CACHE_DIR.mkdir(exist_ok=True, parents=True)
+            temp_path = cached_path.with_name(
+                f"{cached_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+            shutil.copyfile(output_path, temp_path)
+            os.replace(temp_path, cached_path)
+            return result
+        return wrapper
+    return decorator
+
+def _icon_cache_key(self, icon_name: str, spec: "IconSpec", output_path: Path) -> Tuple[bytes, Path]:
+    """Cache key for a UI icon: its name, its spec and this script"""
+    return GENERATOR_DIGEST + f"{icon_name}|{spec!r}".encode(), output_path
+
+# Rasterization backend: resvg (Rust) is much faster, cairosvg is the fallback
+try:
+    import resvg_py
+    RASTERIZER = "resvg"
+    RASTERIZER_VERSION = importlib.metadata.version("resvg-py")
+except ImportError:
+    import cairosvg
+    RASTERIZER = "cairosvg"
+    RASTERIZER_VERSION = importlib.metadata.version("cairosvg")
+
+# Library upgrades can change encoded output, so their versions are part of raster keys
+PILLOW_VERSION = importlib.metadata.version("pillow")
+
+@cached_asset(lambda svg_bytes, output_path, size: 
+              (svg_bytes + f"{size}|{RASTERIZER}|{RASTERIZER_VERSION}".encode(), output_path))
+def _convert_svg_to_png(svg_bytes: bytes, output_path: Path, size: int) -> None:
+    """Convert SVG to PNG at specified size; the output directory must exist"""
+    if RASTERIZER == "resvg":
+        png_bytes = resvg_py.svg_to_bytes(svg_string=svg_bytes.decode("utf-8"), 
+                                          width=size, height=size)
+    else:
+        # Use cairosvg for high-quality rendering
+        png_bytes = cairosvg.svg2png(bytestring=svg_bytes, 
+                                     output_width=size, output_height=size)
+    _write_if_changed(output_path, png_bytes)
+
+def _multisize_key(svg_bytes: bytes, sizes: List[int]) -> bytes:
+    """Cache key for outputs derived from a multi-size render of an SVG"""
+    return (GENERATOR_DIGEST + svg_bytes + 
+            f"{sorted(sizes)}|{PIXEL_PERFECT}|{RASTERIZER}|{RASTERIZER_VERSION}|{PILLOW_VERSION}".encode())
+
+def _drawing_bytes(dwg: svgwrite.Drawing) -> bytes:
+    """Serialize a drawing exactly as Drawing.save() would write it"""
+    return ('<?xml version="1.0" encoding="utf-8" ?>\n' + dwg.tostring()).encode("utf-8")
+
+def _save_image(image: Image.Image, output_path: Path, **params) -> None:
+    """Encode an image in memory and write it only if the file changes"""
+    buffer = io.BytesIO()
+    image.save(buffer, **params)
+    _write_if_changed(output_path, buffer.getvalue())
+
+# JSON backend: orjson serializes natively, the standard library is the fallback
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+except ImportError:
+    JSON_BACKEND = "json"
+
+def _dump_json(data: Dict) -> bytes:
+    """Serialize JSON with two-space indentation"""
+    if JSON_BACKEND == "orjson":
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Match orjson byte for byte: non-ASCII text is written as UTF-8, not escaped
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+class WavePoints(NamedTuple):
+    """Wave coordinates stored as parallel arrays"""
+    xs: np.ndarray
+    ys: np.ndarray
+
+# Gradient vector (x1, y1, x2, y2) for each direction
+GRADIENT_DIRECTIONS: Dict[str, Tuple[float, float, float, float]] = {
+    "horizontal": (0, 0.5, 1, 0.5),
+    "vertical": (0.5, 0, 0.5, 1),
+    "diagonal": (0, 0, 1, 1),
+}
 
 # Create a design system
 class DesignSystem:
@@ -153,14 +355,29 @@ class DesignSystem:
     
     @staticmethod
     def create_wave_path(width: int, height: int, amplitude: float = 0.1, 
-                        frequency: float = 1.0, phase: float = 0.0) -> List[Tuple[float, float]]:
-        """Generate wave path for SVG"""
-        points = []
-        for x in range(width + 1):
-            y = height / 2 + (height * amplitude) * math.sin(
-                (x / width * 2 * math.pi * frequency) + phase)
-            points.append((x, y))
-        return points
+                        frequency: float = 1.0, phase: float = 0.0) -> WavePoints:
+        """Generate wave path for SVG as separate x and y coordinate arrays"""
+        xs = np.arange(width + 1, dtype=np.float64)
+        ys = height / 2 + (height * amplitude) * np.sin(
+            (xs / width * 2 * np.pi * frequency) + phase)
+        return WavePoints(xs, ys)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def wave_path_data(width: int, height: int, amplitude: float = 0.1, 
+                       frequency: float = 1.0, phase: float = 0.0, 
+                       offset_x: float = 0.0, offset_y: float = 0.0) -> str:
+        """Generate the SVG path data for a wave, shifted by the given offset"""
+        xs, ys = DesignSystem.create_wave_path(width, height, amplitude, frequency, phase)
+        
+        # Interleave the shifted coordinates as x0, y0, x1, y1, ...
+        coords = np.empty(2 * len(xs))
+        coords[0::2] = xs + offset_x
+        coords[1::2] = ys + offset_y
+        
+        # One printf-style pass over all coordinates instead of an f-string per point
+        template = "M" + " L".join(["%.2f,%.2f"] * len(xs))
+        return template % tuple(coords.tolist())
     
     @staticmethod
     def create_gradient_filter(dwg: svgwrite.Drawing, id_name: str, 
@@ -169,18 +386,30 @@ class DesignSystem:
         """Create a linear gradient filter for SVG"""
         gradient = dwg.linearGradient(id=id_name)
         
-        if direction == "horizontal":
-            gradient.update({"x1": 0, "y1": 0.5, "x2": 1, "y2": 0.5})
-        elif direction == "vertical":
-            gradient.update({"x1": 0.5, "y1": 0, "x2": 0.5, "y2": 1})
-        elif direction == "diagonal":
-            gradient.update({"x1": 0, "y1": 0, "x2": 1, "y2": 1})
+        if direction in GRADIENT_DIRECTIONS:
+            x1, y1, x2, y2 = GRADIENT_DIRECTIONS[direction]
+            gradient.update({"x1": x1, "y1": y1, "x2": x2, "y2": y2})
         
         gradient.add_stop_color(offset=0, color=start_color)
         gradient.add_stop_color(offset=1, color=end_color)
         
         dwg.defs.add(gradient)
     
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def gradient_xml(id_name: str, start_color: str, end_color: str, 
+                     direction: str = "horizontal") -> str:
+        """Create a linear gradient definition as a raw SVG fragment"""
+        coords = ""
+        if direction in GRADIENT_DIRECTIONS:
+            x1, y1, x2, y2 = GRADIENT_DIRECTIONS[direction]
+            coords = f' x1="{x1}" x2="{x2}" y1="{y1}" y2="{y2}"'
+        
+        return (f'<linearGradient id="{id_name}"{coords}>'
+                f'<stop offset="0" stop-color="{start_color}" />'
+                f'<stop offset="1" stop-color="{end_color}" />'
+                '</linearGradient>')
+    
     @staticmethod
     def create_drop_shadow_filter(dwg: svgwrite.Drawing, id_name: str, 
                                 stdDeviation: float = 3) -> None:
@@ -206,27 +435,273 @@ class DesignSystem:
         comp_transfer.feFuncA(type_="linear", slope=0.7)
         
         filter_effect.feBlend(in_="SourceGraphic", mode="screen")
-        
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def glow_filter_xml(id_name: str, color: str = BrandColors.ACCENT, 
+                        strength: float = 3) -> str:
+        """Create a glow filter definition as a raw SVG fragment"""
+        return (f'<filter id="{id_name}">'
+                '<feColorMatrix in="SourceGraphic" type="matrix" '
+                'values="0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 0" />'
+                f'<feGaussianBlur in="SourceGraphic" stdDeviation="{strength}" />'
+                '<feComponentTransfer in="SourceGraphic"><feFuncA slope="0.7" type="linear" />'
+                '</feComponentTransfer>'
+                '<feBlend in="SourceGraphic" mode="screen" />'
+                '</filter>')
+        
+# Unit (cos, sin) directions for the eight light rays around the bulb
+_RAY_DIRS = tuple((math.cos(i * math.pi / 4), math.sin(i * math.pi / 4)) for i in range(8))
+
+def _ray_endpoints(cx: float, cy: float, inner_r: float, 
+                   outer_r: float) -> List[Tuple[float, float, float, float]]:
+    """Start and end points (x1, y1, x2, y2) of the rays around a bulb"""
+    return [(cx + inner_r * cos_a, cy + inner_r * sin_a, cx + outer_r * cos_a, cy + outer_r * sin_a)
+            for cos_a, sin_a in _RAY_DIRS]
+
+# UI icon specs
+def _gear_points(center: float = 12, outer_radius: float = 24 * 0.4, 
+                 inner_radius: float = 24 * 0.25, teeth: int = 8) -> str:
+    """Polygon points for the settings gear"""
+    points = []
+    for i in range(teeth * 2):
+        angle = i * math.pi / teeth
+        radius = outer_radius if i % 2 == 0 else inner_radius
+        points.append(f"{center + radius * math.cos(angle)},{center + radius * math.sin(angle)}")
+    return " ".join(points)
+
+# Stand-in for the icon's own gradient in element attributes
+GRADIENT = "url(#{gradient_id})"
+
+# Document wrapper, matching what svgwrite's Drawing.save() writes
+SVG_DOCUMENT = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg baseProfile="full" height="{height}px" version="1.1" width="{width}px" '
+    'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink">'
+    '<defs>{defs}</defs>{body}</svg>'
+)
+
+# Document wrapper shared by every 24px UI icon
+ICON_DOCUMENT = SVG_DOCUMENT.format(width=24, height=24, defs="{defs}", body="{body}")
+
+# A single light ray around the bulb
+RAY_TEMPLATE = (
+    '<line opacity="{opacity}" stroke="url(#{gradient_id})" stroke-linecap="round" '
+    'stroke-width="{stroke_width}" x1="{x1}" x2="{x2}" y1="{y1}" y2="{y2}" />'
+)
+
+# Logo content: two waves, the bulb with its rays and the wordmark
+LOGO_BODY = (
+    '<path d="{wave1}" fill="none" filter="url(#logoGlow)" stroke="url(#logoGradient)" '
+    'stroke-linecap="round" stroke-width="6" />'
+    '<path d="{wave2}" fill="none" opacity="0.8" stroke="url(#logoGradient)" '
+    'stroke-linecap="round" stroke-width="4" />'
+    '<g>{rays}<circle cx="45" cy="30" fill="url(#logoGradient)" r="18" /></g>'
+    '<g font-family="Arial, sans-serif" font-weight="bold">'
+    '<text fill="{primary}" font-size="24" x="75" y="35">Insight</text>'
+    '<text fill="{accent}" font-size="24" x="75" y="60">Wave</text></g>'
+)
+
+# App icon content: rays, rounded background, wave and bulb
+APP_ICON_BODY = (
+    '{rays}'
+    '<rect fill="{background}" height="{size}" rx="{radius}" ry="{radius}" '
+    'width="{size}" x="0" y="0" />'
+    '<path d="{wave}" fill="none" filter="url(#iconGlow)" stroke="url(#iconGradient)" '
+    'stroke-linecap="round" stroke-width="{wave_stroke}" />'
+    '<circle cx="{bulb_cx}" cy="{bulb_cy}" fill="url(#iconGradient)" '
+    'filter="url(#iconGlow)" r="{bulb_r}" />'
+)
+
+# Markup for a single shape; attributes are emitted in sorted order
+ELEMENT_TEMPLATE = "<{tag} {attributes} />"
+
+@dataclass(frozen=True)
+class IconSpec:
+    """Declarative description of a 24px UI icon"""
+    gradient_id: str
+    gradient_stops: Tuple[str, str]
+    elements: List[Tuple[str, Dict[str, Union[str, float]]]] = field(default_factory=list)
+
+ICON_SPECS: Dict[str, IconSpec] = {
+    # Paper plane
+    "send": IconSpec("sendGradient", (BrandColors.PRIMARY, BrandColors.ACCENT), [
+        ("polygon", {"points": "2,2 22,12 2,22 8,12", "fill": GRADIENT}),
+    ]),
+    # Gear with center hole
+    "settings": IconSpec("settingsGradient", (BrandColors.PRIMARY, BrandColors.SECONDARY), [
+        ("polygon", {"points": _gear_points(), "fill": GRADIENT}),
+        ("circle", {"cx": 12.0, "cy": 12.0, "r": 24 * 0.12, "fill": "white"}),
+    ]),
+    # X shape
+    "close": IconSpec("closeGradient", (BrandColors.ERROR, BrandColors.SECONDARY), [
+        ("line", {"x1": 4, "y1": 4, "x2": 20, "y2": 20, "stroke": GRADIENT, 
+                  "stroke-width": 3, "stroke-linecap": "round"}),
+        ("line", {"x1": 4, "y1": 20, "x2": 20, "y2": 4, "stroke": GRADIENT, 
+                  "stroke-width": 3, "stroke-linecap": "round"}),
+    ]),
+    # Hamburger menu
+    "menu": IconSpec("menuGradient", (BrandColors.PRIMARY, BrandColors.ACCENT), [
+        ("line", {"x1": 4, "y1": y, "x2": 20, "y2": y, "stroke": GRADIENT, 
+                  "stroke-width": 2, "stroke-linecap": "round"})
+        for y in (6, 12, 18)
+    ]),
+    # Head and body
+    "user": IconSpec("userGradient", (BrandColors.PRIMARY, BrandColors.SECONDARY), [
+        ("circle", {"cx": 12, "cy": 8, "r": 5, "fill": GRADIENT}),
+        ("path", {"d": "M4,21 A8,5 0 0 1 20,21", "fill": "none", "stroke": GRADIENT, 
+                  "stroke-width": 2}),
+    ]),
+    # Robot face with eyes, mouth and antenna
+    "assistant": IconSpec("assistantGradient", (BrandColors.ACCENT, BrandColors.PRIMARY), [
+        ("rect", {"x": 4, "y": 4, "width": 16, "height": 16, "rx": 4, "ry": 4, "fill": GRADIENT}),
+        ("circle", {"cx": 9, "cy": 10, "r": 1.5, "fill": "white"}),
+        ("circle", {"cx": 15, "cy": 10, "r": 1.5, "fill": "white"}),
+        ("path", {"d": "M8,16 L16,16", "stroke": "white", "stroke-width": 1.5, 
+                  "stroke-linecap": "round"}),
+        ("path", {"d": "M12,4 L12,1 M9,2 L15,2", "stroke": GRADIENT, "stroke-width": 1.5, 
+                  "stroke-linecap": "round"}),
+    ]),
+    # Paperclip
+    "attachment": IconSpec("attachGradient", (BrandColors.PRIMARY, BrandColors.SECONDARY), [
+        ("path", {"d": "M21.44,11.05l-9.19,9.19a6,6,0,0,1-8.49-8.49l9.19-9.19a4,4,0,0,1,5.66,5.66"
+                       "l-9.2,9.19a2,2,0,0,1-2.83-2.83l8.49-8.48",
+                  "fill": "none", "stroke": GRADIENT, "stroke-width": 2, 
+                  "stroke-linecap": "round", "stroke-linejoin": "round"}),
+    ]),
+    # Clipboard with a lined sheet
+    "copy": IconSpec("copyGradient", (BrandColors.PRIMARY, BrandColors.ACCENT), [
+        ("rect", {"x": 7, "y": 4, "width": 12, "height": 16, "rx": 1, "ry": 1, 
+                  "fill": "none", "stroke": GRADIENT, "stroke-width": 1.5}),
+        ("rect", {"x": 4, "y": 7, "width": 12, "height": 16, "rx": 1, "ry": 1, 
+                  "fill": "white", "stroke": GRADIENT, "stroke-width": 1.5}),
+        ("line", {"x1": 7, "y1": 12, "x2": 13, "y2": 12, "stroke": GRADIENT, 
+                  "stroke-width": 1, "stroke-linecap": "round"}),
+        ("line", {"x1": 7, "y1": 15, "x2": 13, "y2": 15, "stroke": GRADIENT, 
+                  "stroke-width": 1, "stroke-linecap": "round"}),
+        ("line", {"x1": 7, "y1": 18, "x2": 11, "y2": 18, "stroke": GRADIENT, 
+                  "stroke-width": 1, "stroke-linecap": "round"}),
+    ]),
+    # Arrow over a baseline
+    "download": IconSpec("downloadGradient", (BrandColors.PRIMARY, BrandColors.SUCCESS), [
+        ("path", {"d": "M12,4 L12,16 M7,12 L12,17 L17,12", "fill": "none", "stroke": GRADIENT, 
+                  "stroke-width": 2, "stroke-linecap": "round"}),
+        ("path", {"d": "M4,20 L20,20", "stroke": GRADIENT, "stroke-width": 2, 
+                  "stroke-linecap": "round"}),
+    ]),
+    # Pencil
+    "edit": IconSpec("editGradient", (BrandColors.PRIMARY, BrandColors.WARNING), [
+        ("path", {"d": "M17,3 L21,7 L7,21 L3,21 L3,17 L17,3 Z", "fill": "none", 
+                  "stroke": GRADIENT, "stroke-width": 1.5, 
+                  "stroke-linecap": "round", "stroke-linejoin": "round"}),
+        ("path", {"d": "M15,5 L19,9", "stroke": GRADIENT, "stroke-width": 1, 
+                  "stroke-linecap": "round"}),
+    ]),
+    # Trash can with lid
+    "delete": IconSpec("deleteGradient", (BrandColors.ERROR, BrandColors.SECONDARY), [
+        ("path", {"d": "M5,6 L19,6 L18,21 L6,21 L5,6 Z", "fill": "none", "stroke": GRADIENT, 
+                  "stroke-width": 1.5, "stroke-linecap": "round", "stroke-linejoin": "round"}),
+        ("path", {"d": "M3,6 L21,6 M9,3 L15,3 L15,6", "stroke": GRADIENT, "stroke-width": 1.5, 
+                  "stroke-linecap": "round", "stroke-linejoin": "round"}),
+        ("line", {"x1": 10, "y1": 10, "x2": 10, "y2": 17, "stroke": GRADIENT, 
+                  "stroke-width": 1.5, "stroke-linecap": "round"}),
+        ("line", {"x1": 14, "y1": 10, "x2": 14, "y2": 17, "stroke": GRADIENT, 
+                  "stroke-width": 1.5, "stroke-linecap": "round"}),
+    ]),
+    # Palette with color dots
+    "theme": IconSpec("themeGradient", (BrandColors.PRIMARY, BrandColors.SECONDARY), [
+        *[("circle", {"cx": x, "cy": y, "r": 1.5, "fill": color})
+          for color, (x, y) in zip(
+              [BrandColors.PRIMARY, BrandColors.SECONDARY, BrandColors.ACCENT, BrandColors.SUCCESS],
+              [(8, 8), (12, 10), (8, 14), (16, 8)])],
+        ("path", {"d": "M12,2 A10,10 0 1 0 17.5,21 A4,4 0 0 1 17.5,13 A4,4 0 0 1 21.5,13 "
+                       "C21.5,10 20,2 12,2 Z",
+                  "fill": "none", "stroke": GRADIENT, "stroke-width": 1.5, 
+                  "stroke-linecap": "round", "stroke-linejoin": "round"}),
+    ]),
+    # Bell with ringer
+    "notification": IconSpec("notifyGradient", (BrandColors.WARNING, BrandColors.ACCENT), [
+        ("path", {"d": "M18,8 A6,6 0 0 0 6,8 C6,18 3,20 3,20 L21,20 C21,20 18,18 18,8 Z", 
+                  "fill": "none", "stroke": GRADIENT, "stroke-width": 1.5, 
+                  "stroke-linecap": "round", "stroke-linejoin": "round"}),
+        ("path", {"d": "M12,20 L12,22", "stroke": GRADIENT, "stroke-width": 1.5, 
+                  "stroke-linecap": "round"}),
+        ("circle", {"cx": 12, "cy": 3, "r": 1, "fill": GRADIENT}),
+    ]),
+}
+
+# Patterns for deriving the monochrome Safari pinned-tab icon. Each one starts
+# with a literal that sre locates with its fast substring search; hand-written
+# str.find scanners measured no faster on the ~9 KB app icon, so they stay.
+# Merging them into one alternation loses that prefix search and is slower.
+_RE_FILL_URL = re.compile(r'fill="url\(#[^"]+\)"')
+_RE_STROKE_URL = re.compile(r'stroke="url\(#[^"]+\)"')
+_RE_FILTER_ATTR = re.compile(r'filter="[^"]+"')
+_RE_LINEAR_GRAD = re.compile(r'<linearGradient[^>]*>.*?</linearGradient>', re.DOTALL)
+_RE_FILTER_DEF = re.compile(r'<filter[^>]*>.*?</filter>', re.DOTALL)
+
 # Asset generator class
 class AssetGenerator:
     """Generates all assets for the InsightWave application"""
     
     def __init__(self):
         self.design = DesignSystem()
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_ctx: Optional[tempfile.TemporaryDirectory] = None
+        self._last_manifest: Optional[Dict] = None
     
-    def __del__(self):
-        # Clean up temp directory
-        try:
-            shutil.rmtree(self.temp_dir)
-        except:
-            pass
+    def __enter__(self) -> "AssetGenerator":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+    
+    @property
+    def temp_dir(self) -> str:
+        """Scratch directory, created on first use"""
+        if self._temp_ctx is None:
+            self._temp_ctx = tempfile.TemporaryDirectory()
+        return self._temp_ctx.name
+    
+    def close(self) -> None:
+        """Remove the temporary directory if one was created"""
+        if self._temp_ctx is not None:
+            self._temp_ctx.cleanup()
+            self._temp_ctx = None
     
     def generate_logo_svg(self, output_path: Path) -> None:
         """Generate the InsightWave logo in SVG format"""
+        svg_bytes = self._logo_drawing() if USE_SVGWRITE else self._logo_markup()
+        _write_if_changed(output_path, svg_bytes)
+        console.print(f"✓ Created logo: [cyan]{output_path}[/cyan]")
+    
+    def _logo_markup(self) -> bytes:
+        """Build the logo SVG from string templates"""
+        width, height = 240, 80
+        
+        defs = (self.design.gradient_xml("logoGradient", BrandColors.GRADIENT_START, 
+                                         BrandColors.GRADIENT_END) + 
+                self.design.glow_filter_xml("logoGlow"))
+        
+        wave1 = self.design.wave_path_data(width, height // 2, amplitude=0.35, 
+                                           frequency=1.5, phase=0, offset_y=10)
+        wave2 = self.design.wave_path_data(width, height // 2, amplitude=0.25, 
+                                           frequency=1.8, phase=math.pi/2, offset_y=25)
+        
+        rays = "".join(
+            RAY_TEMPLATE.format(opacity=0.6, gradient_id="logoGradient", stroke_width=2, 
+                                x1=45, x2=ray_x, y1=30, y2=ray_y)
+            for _, _, ray_x, ray_y in _ray_endpoints(45, 30, 0, 25))
+        
+        body = LOGO_BODY.format(wave1=wave1, wave2=wave2, rays=rays, 
+                                primary=BrandColors.PRIMARY, accent=BrandColors.ACCENT)
+        return SVG_DOCUMENT.format(width=width, height=height, defs=defs, body=body).encode("utf-8")
+    
+    def _logo_drawing(self) -> bytes:
+        """Build the logo SVG through svgwrite (slow path, for debugging)"""
         width, height = 240, 80
         # Use standard SVG profile (not 'tiny')
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{width}px", f"{height}px"))
+        dwg = svgwrite.Drawing(size=(f"{width}px", f"{height}px"))
         
         # Create filters and gradients
         self.design.create_gradient_filter(dwg, "logoGradient", 
@@ -235,18 +710,18 @@ class AssetGenerator:
         self.design.create_glow_filter(dwg, "logoGlow")
         
         # Create the wave paths
-        wave1 = self.design.create_wave_path(width, height // 2, 
-                                           amplitude=0.35, frequency=1.5, phase=0)
-        wave2 = self.design.create_wave_path(width, height // 2, 
-                                           amplitude=0.25, frequency=1.8, phase=math.pi/2)
+        wave1 = self.design.wave_path_data(width, height // 2, amplitude=0.35, 
+                                           frequency=1.5, phase=0, offset_y=10)
+        wave2 = self.design.wave_path_data(width, height // 2, amplitude=0.25, 
+                                           frequency=1.8, phase=math.pi/2, offset_y=25)
         
         # Draw the waves
-        wave1_path = dwg.path(d="M" + " L".join([f"{x},{y+10}" for x, y in wave1]), 
+        wave1_path = dwg.path(d=wave1, 
                             stroke_width=6, stroke="url(#logoGradient)", 
                             fill="none", stroke_linecap="round",
                             filter="url(#logoGlow)")
         
-        wave2_path = dwg.path(d="M" + " L".join([f"{x},{y+25}" for x, y in wave2]), 
+        wave2_path = dwg.path(d=wave2, 
                             stroke_width=4, stroke="url(#logoGradient)", 
                             fill="none", stroke_linecap="round",
                             opacity=0.8)
@@ -259,10 +734,7 @@ class AssetGenerator:
                              fill="url(#logoGradient)")
         
         # Light rays (simplified)
-        for i in range(8):
-            angle = i * math.pi / 4
-            ray_x = 45 + 25 * math.cos(angle)
-            ray_y = 30 + 25 * math.sin(angle)
+        for _, _, ray_x, ray_y in _ray_endpoints(45, 30, 0, 25):
             ray = dwg.line(start=(45, 30), end=(ray_x, ray_y), 
                          stroke="url(#logoGradient)", stroke_width=2, 
                          opacity=0.6, stroke_linecap="round")
@@ -282,403 +754,47 @@ class AssetGenerator:
         text_group.add(wave_text)
         dwg.add(text_group)
         
-        # Save the SVG
-        dwg.save()
-        console.print(f"✓ Created logo: [cyan]{output_path}[/cyan]")
+        return _drawing_bytes(dwg)
     
     def generate_ui_icons(self) -> None:
         """Generate all UI icons in SVG format"""
-        icon_specs = {
-            "send": self._create_send_icon,
-            "settings": self._create_settings_icon,
-            "close": self._create_close_icon,
-            "menu": self._create_menu_icon,
-            "user": self._create_user_icon,
-            "assistant": self._create_assistant_icon,
-            "attachment": self._create_attachment_icon,
-            "copy": self._create_copy_icon,
-            "download": self._create_download_icon,
-            "edit": self._create_edit_icon,
-            "delete": self._create_delete_icon,
-            "theme": self._create_theme_icon,
-            "notification": self._create_notification_icon,
-        }
-        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
-            overall_task = progress.add_task("[cyan]Generating UI icons...", total=len(icon_specs))
+            overall_task = progress.add_task("[cyan]Generating UI icons...", total=len(ICON_SPECS))
             
-            for icon_name, create_func in icon_specs.items():
-                output_path = ICONS_DIR / f"{icon_name}.svg"
-                create_func(output_path)
-                progress.update(overall_task, advance=1)
+            # Rendering is cheap, overlap the file writes across threads
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(self._render_icon_spec, icon_name, spec, 
+                                           ICONS_DIR / f"{icon_name}.svg")
+                           for icon_name, spec in ICON_SPECS.items()]
                 
-        console.print(f"✓ Created [bold]{len(icon_specs)}[/bold] UI icons in [cyan]{ICONS_DIR}[/cyan]")
-    
-    # All icon creation methods - only showing one as example since they all follow the same pattern
-    def _create_send_icon(self, output_path: Path) -> None:
-        """Create the send message icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "sendGradient", 
-                                         BrandColors.PRIMARY, BrandColors.ACCENT)
-        
-        # Create paper plane shape
-        points = [
-            (2, 2),      # Top left
-            (22, 12),    # Right point
-            (2, 22),     # Bottom left
-            (8, 12)      # Middle indentation
-        ]
-        
-        # Draw the shape
-        plane = dwg.polygon(points=points, fill="url(#sendGradient)")
-        dwg.add(plane)
-        
-        # Save the icon
-        dwg.save()
-    
-    # [Remaining icon creation methods would go here...]
-    
-    def _create_settings_icon(self, output_path: Path) -> None:
-        """Create the settings icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "settingsGradient", 
-                                         BrandColors.PRIMARY, BrandColors.SECONDARY)
-        
-        # Create gear shape
-        center = size / 2
-        outer_radius = size * 0.4
-        inner_radius = size * 0.25
-        teeth = 8
-        
-        gear_path = []
-        
-        for i in range(teeth * 2):
-            angle = i * math.pi / teeth
-            radius = outer_radius if i % 2 == 0 else inner_radius
-            x = center + radius * math.cos(angle)
-            y = center + radius * math.sin(angle)
-            gear_path.append((x, y))
-        
-        # Create center circle
-        center_circle = dwg.circle(center=(center, center), r=size * 0.12, 
-                                 fill="white")
-        
-        # Draw the shape
-        gear = dwg.polygon(points=gear_path, fill="url(#settingsGradient)")
-        dwg.add(gear)
-        dwg.add(center_circle)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_close_icon(self, output_path: Path) -> None:
-        """Create a close (X) icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "closeGradient", 
-                                         BrandColors.ERROR, BrandColors.SECONDARY)
-        
-        # Create X shape
-        line1 = dwg.line(start=(4, 4), end=(20, 20), stroke="url(#closeGradient)", 
-                       stroke_width=3, stroke_linecap="round")
-        line2 = dwg.line(start=(4, 20), end=(20, 4), stroke="url(#closeGradient)", 
-                       stroke_width=3, stroke_linecap="round")
-        
-        dwg.add(line1)
-        dwg.add(line2)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_menu_icon(self, output_path: Path) -> None:
-        """Create a hamburger menu icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "menuGradient", 
-                                         BrandColors.PRIMARY, BrandColors.ACCENT)
-        
-        # Create three horizontal lines
-        line1 = dwg.line(start=(4, 6), end=(20, 6), stroke="url(#menuGradient)", 
-                       stroke_width=2, stroke_linecap="round")
-        line2 = dwg.line(start=(4, 12), end=(20, 12), stroke="url(#menuGradient)", 
-                       stroke_width=2, stroke_linecap="round")
-        line3 = dwg.line(start=(4, 18), end=(20, 18), stroke="url(#menuGradient)", 
-                       stroke_width=2, stroke_linecap="round")
-        
-        dwg.add(line1)
-        dwg.add(line2)
-        dwg.add(line3)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_user_icon(self, output_path: Path) -> None:
-        """Create a user/person icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "userGradient", 
-                                         BrandColors.PRIMARY, BrandColors.SECONDARY)
-        
-        # Create head and body
-        head = dwg.circle(center=(12, 8), r=5, fill="url(#userGradient)")
-        body = dwg.path(d="M4,21 A8,5 0 0 1 20,21", fill="none", 
-                      stroke="url(#userGradient)", stroke_width=2)
-        
-        dwg.add(head)
-        dwg.add(body)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_assistant_icon(self, output_path: Path) -> None:
-        """Create an AI assistant icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "assistantGradient", 
-                                         BrandColors.ACCENT, BrandColors.PRIMARY)
-        
-        # Create robot face
-        face = dwg.rect(insert=(4, 4), size=(16, 16), rx=4, ry=4, 
-                      fill="url(#assistantGradient)")
-        
-        # Create eyes
-        eye1 = dwg.circle(center=(9, 10), r=1.5, fill="white")
-        eye2 = dwg.circle(center=(15, 10), r=1.5, fill="white")
-        
-        # Create mouth
-        mouth = dwg.path(d="M8,16 L16,16", stroke="white", stroke_width=1.5, 
-                       stroke_linecap="round")
-        
-        # Add antenna
-        antenna = dwg.path(d="M12,4 L12,1 M9,2 L15,2", stroke="url(#assistantGradient)", 
-                         stroke_width=1.5, stroke_linecap="round")
-        
-        dwg.add(face)
-        dwg.add(eye1)
-        dwg.add(eye2)
-        dwg.add(mouth)
-        dwg.add(antenna)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_attachment_icon(self, output_path: Path) -> None:
-        """Create an attachment/paperclip icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "attachGradient", 
-                                         BrandColors.PRIMARY, BrandColors.SECONDARY)
-        
-        # Create paperclip shape
-        clip = dwg.path(
-            d="M21.44,11.05l-9.19,9.19a6,6,0,0,1-8.49-8.49l9.19-9.19a4,4,0,0,1,5.66,5.66l-9.2,9.19a2,2,0,0,1-2.83-2.83l8.49-8.48",
-            fill="none", stroke="url(#attachGradient)", stroke_width=2, 
-            stroke_linecap="round", stroke_linejoin="round")
-        
-        dwg.add(clip)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_copy_icon(self, output_path: Path) -> None:
-        """Create a copy to clipboard icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "copyGradient", 
-                                         BrandColors.PRIMARY, BrandColors.ACCENT)
-        
-        # Create clipboard shape
-        board = dwg.rect(insert=(7, 4), size=(12, 16), rx=1, ry=1, 
-                       fill="none", stroke="url(#copyGradient)", stroke_width=1.5)
-        
-        paper = dwg.rect(insert=(4, 7), size=(12, 16), rx=1, ry=1, 
-                       fill="white", stroke="url(#copyGradient)", stroke_width=1.5)
-        
-        # Create lines on the paper
-        line1 = dwg.line(start=(7, 12), end=(13, 12), stroke="url(#copyGradient)", 
-                       stroke_width=1, stroke_linecap="round")
-        line2 = dwg.line(start=(7, 15), end=(13, 15), stroke="url(#copyGradient)", 
-                       stroke_width=1, stroke_linecap="round")
-        line3 = dwg.line(start=(7, 18), end=(11, 18), stroke="url(#copyGradient)", 
-                       stroke_width=1, stroke_linecap="round")
-        
-        dwg.add(board)
-        dwg.add(paper)
-        dwg.add(line1)
-        dwg.add(line2)
-        dwg.add(line3)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_download_icon(self, output_path: Path) -> None:
-        """Create a download icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "downloadGradient", 
-                                         BrandColors.PRIMARY, BrandColors.SUCCESS)
-        
-        # Create download arrow
-        arrow = dwg.path(
-            d="M12,4 L12,16 M7,12 L12,17 L17,12",
-            fill="none", stroke="url(#downloadGradient)", stroke_width=2, 
-            stroke_linecap="round")
-        
-        # Create line at bottom
-        line = dwg.path(d="M4,20 L20,20", stroke="url(#downloadGradient)", 
-                       stroke_width=2, stroke_linecap="round")
-        
-        dwg.add(arrow)
-        dwg.add(line)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_edit_icon(self, output_path: Path) -> None:
-        """Create an edit/pencil icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "editGradient", 
-                                         BrandColors.PRIMARY, BrandColors.WARNING)
-        
-        # Create pencil shape
-        pencil = dwg.path(
-            d="M17,3 L21,7 L7,21 L3,21 L3,17 L17,3 Z",
-            fill="none", stroke="url(#editGradient)", stroke_width=1.5, 
-            stroke_linecap="round", stroke_linejoin="round")
-        
-        # Create line for pencil tip details
-        line = dwg.path(d="M15,5 L19,9", stroke="url(#editGradient)", 
-                       stroke_width=1, stroke_linecap="round")
-        
-        dwg.add(pencil)
-        dwg.add(line)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_delete_icon(self, output_path: Path) -> None:
-        """Create a delete/trash icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "deleteGradient", 
-                                         BrandColors.ERROR, BrandColors.SECONDARY)
-        
-        # Create trash can
-        can = dwg.path(
-            d="M5,6 L19,6 L18,21 L6,21 L5,6 Z",
-            fill="none", stroke="url(#deleteGradient)", stroke_width=1.5, 
-            stroke_linecap="round", stroke_linejoin="round")
-        
-        # Create lid
-        lid = dwg.path(d="M3,6 L21,6 M9,3 L15,3 L15,6", stroke="url(#deleteGradient)", 
-                     stroke_width=1.5, stroke_linecap="round", stroke_linejoin="round")
-        
-        # Create lines on the can
-        line1 = dwg.line(start=(10, 10), end=(10, 17), stroke="url(#deleteGradient)", 
-                        stroke_width=1.5, stroke_linecap="round")
-        line2 = dwg.line(start=(14, 10), end=(14, 17), stroke="url(#deleteGradient)", 
-                        stroke_width=1.5, stroke_linecap="round")
-        
-        dwg.add(can)
-        dwg.add(lid)
-        dwg.add(line1)
-        dwg.add(line2)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_theme_icon(self, output_path: Path) -> None:
-        """Create a theme/palette icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "themeGradient", 
-                                         BrandColors.PRIMARY, BrandColors.SECONDARY)
-        
-        # Create palette shape
-        palette = dwg.path(
-            d="M12,2 A10,10 0 1 0 17.5,21 A4,4 0 0 1 17.5,13 A4,4 0 0 1 21.5,13 C21.5,10 20,2 12,2 Z",
-            fill="none", stroke="url(#themeGradient)", stroke_width=1.5, 
-            stroke_linecap="round", stroke_linejoin="round")
-        
-        # Create color dots
-        colors = [BrandColors.PRIMARY, BrandColors.SECONDARY, 
-                  BrandColors.ACCENT, BrandColors.SUCCESS]
-        positions = [(8, 8), (12, 10), (8, 14), (16, 8)]
-        
-        for i, (color, pos) in enumerate(zip(colors, positions)):
-            dot = dwg.circle(center=pos, r=1.5, fill=color)
-            dwg.add(dot)
-        
-        dwg.add(palette)
-        
-        # Save the icon
-        dwg.save()
-    
-    def _create_notification_icon(self, output_path: Path) -> None:
-        """Create a notification/bell icon"""
-        size = 24
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
-        
-        # Create gradient
-        self.design.create_gradient_filter(dwg, "notifyGradient", 
-                                         BrandColors.WARNING, BrandColors.ACCENT)
-        
-        # Create bell shape
-        bell = dwg.path(
-            d="M18,8 A6,6 0 0 0 6,8 C6,18 3,20 3,20 L21,20 C21,20 18,18 18,8 Z",
-            fill="none", stroke="url(#notifyGradient)", stroke_width=1.5, 
-            stroke_linecap="round", stroke_linejoin="round")
-        
-        # Create ringer at bottom
-        ringer = dwg.path(d="M12,20 L12,22", stroke="url(#notifyGradient)", 
-                         stroke_width=1.5, stroke_linecap="round")
-        
-        # Create dot at top
-        dot = dwg.circle(center=(12, 3), r=1, fill="url(#notifyGradient)")
-        
-        dwg.add(bell)
-        dwg.add(ringer)
-        dwg.add(dot)
-        
-        # Save the icon
-        dwg.save()
+                for future in as_completed(futures):
+                    future.result()
+                    progress.update(overall_task, advance=1)
+                
+        console.print(f"✓ Created [bold]{len(ICON_SPECS)}[/bold] UI icons in [cyan]{ICONS_DIR}[/cyan]")
+    
+    @cached_asset(_icon_cache_key)
+    def _render_icon_spec(self, icon_name: str, spec: IconSpec, output_path: Path) -> None:
+        """Render a UI icon from its spec"""
+        body = "".join(
+            ELEMENT_TEMPLATE.format(tag=tag, attributes=" ".join(
+                f'{name}="{str(value).format(gradient_id=spec.gradient_id)}"'
+                for name, value in sorted(attributes.items())))
+            for tag, attributes in spec.elements)
+        
+        defs = self.design.gradient_xml(spec.gradient_id, *spec.gradient_stops)
+        svg = ICON_DOCUMENT.format(defs=defs, body=body)
+        
+        _write_if_changed(output_path, svg.encode("utf-8"))
     
     def generate_app_icons(self) -> None:
         """Generate app icons for various platforms and sizes"""
-        # First, create a high-quality base SVG
-        base_svg_path = Path(self.temp_dir) / "app-icon-base.svg"
-        self._create_app_icon_svg(base_svg_path)
+        # First, create a high-quality base SVG; every output is derived from these bytes
+        base_svg = self._create_app_icon_svg()
         
         # Define sizes needed for various platforms
         icon_sizes = {
@@ -711,30 +827,69 @@ class AssetGenerator:
             overall_task = progress.add_task(
                 "[cyan]Generating app icons...", total=len(icon_sizes) + 1)  # +1 for favicon
             
-            # Generate PNG icons
-            for filename, size in icon_sizes.items():
-                output_path = IMAGES_DIR / filename
-                
-                # Convert SVG to PNG at specified size
-                self._convert_svg_to_png(base_svg_path, output_path, size)
+            # Every size is rendered in one go, and only if some output misses the cache
+            render = self._lazy_multisize(base_svg, list(icon_sizes.values()) + favicon_sizes)
+            
+            # Encode the PNGs concurrently; Pillow releases the GIL while compressing
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [executor.submit(self._save_app_icon, base_svg, render, size, 
+                                           IMAGES_DIR / filename)
+                           for filename, size in icon_sizes.items()]
                 
-                progress.update(overall_task, advance=1)
+                for future in as_completed(futures):
+                    future.result()
+                    progress.update(overall_task, advance=1)
             
             # Generate favicon.ico (multi-size)
             favicon_path = IMAGES_DIR / "favicon.ico"
-            self._create_favicon(base_svg_path, favicon_path, favicon_sizes)
+            self._create_favicon(base_svg, render, favicon_sizes, favicon_path)
             progress.update(overall_task, advance=1)
             
             # Create a monochrome SVG for Safari pinned tab (special case)
             safari_svg_path = IMAGES_DIR / "safari-pinned-tab.svg"
-            self._create_monochrome_svg_icon(base_svg_path, safari_svg_path)
+            self._create_monochrome_svg_icon(base_svg, safari_svg_path)
         
         console.print(f"✓ Created [bold]{len(icon_sizes) + 2}[/bold] app icons in [cyan]{IMAGES_DIR}[/cyan]")
         
-    def _create_app_icon_svg(self, output_path: Path) -> None:
+    def _create_app_icon_svg(self) -> bytes:
         """Create the app icon as SVG"""
+        return self._app_icon_drawing() if USE_SVGWRITE else self._app_icon_markup()
+    
+    def _app_icon_markup(self) -> bytes:
+        """Build the app icon SVG from string templates"""
         size = 512  # Base size
-        dwg = svgwrite.Drawing(str(output_path), size=(f"{size}px", f"{size}px"))
+        
+        defs = (self.design.gradient_xml("iconGradient", BrandColors.GRADIENT_START, 
+                                         BrandColors.GRADIENT_END, direction="diagonal") + 
+                self.design.glow_filter_xml("iconGlow", color=BrandColors.ACCENT, strength=4))
+        
+        # Wave across the lower half
+        cx, cy = size/2, size/2
+        wave_height = size * 0.5
+        wave_width = size * 0.8
+        wave = self.design.wave_path_data(
+            int(wave_width), int(wave_height), amplitude=0.3, frequency=1.5, 
+            offset_x=(size - wave_width) / 2, offset_y=cy + size * 0.05)
+        
+        # Lightbulb/insight icon with its rays
+        bulb_cx = cx
+        bulb_cy = cy - size * 0.15
+        bulb_r = size * 0.12
+        rays = "".join(
+            RAY_TEMPLATE.format(opacity=0.8, gradient_id="iconGradient", stroke_width=size / 60, 
+                                x1=start_x, x2=end_x, y1=start_y, y2=end_y)
+            for start_x, start_y, end_x, end_y 
+            in _ray_endpoints(bulb_cx, bulb_cy, bulb_r * 1.1, bulb_r * 1.6))
+        
+        body = APP_ICON_BODY.format(rays=rays, background=BrandColors.DARK, size=size, 
+                                    radius=size/4, wave=wave, wave_stroke=size/25, 
+                                    bulb_cx=bulb_cx, bulb_cy=bulb_cy, bulb_r=bulb_r)
+        return SVG_DOCUMENT.format(width=size, height=size, defs=defs, body=body).encode("utf-8")
+    
+    def _app_icon_drawing(self) -> bytes:
+        """Build the app icon SVG through svgwrite (slow path, for debugging)"""
+        size = 512  # Base size
+        dwg = svgwrite.Drawing(size=(f"{size}px", f"{size}px"))
         
         # Create filters and gradients
         self.design.create_gradient_filter(dwg, "iconGradient", 
@@ -757,11 +912,12 @@ class AssetGenerator:
         wave1_start_x = (size - wave_width) / 2
         wave1_start_y = cy + size * 0.05
         
-        wave1_points = self.design.create_wave_path(
-            int(wave_width), int(wave_height), amplitude=0.3, frequency=1.5)
+        wave1_data = self.design.wave_path_data(
+            int(wave_width), int(wave_height), amplitude=0.3, frequency=1.5, 
+            offset_x=wave1_start_x, offset_y=wave1_start_y)
         
         wave1_path = dwg.path(
-            d="M" + " L".join([f"{x+wave1_start_x},{y+wave1_start_y}" for x, y in wave1_points]), 
+            d=wave1_data, 
             stroke_width=size/25, stroke="url(#iconGradient)", 
             fill="none", stroke_linecap="round",
             filter="url(#iconGlow)")
@@ -776,18 +932,12 @@ class AssetGenerator:
                         filter="url(#iconGlow)")
         
         # Light rays
-        for i in range(8):
-            angle = i * math.pi / 4
-            inner_r = bulb_r * 1.1
-            outer_r = bulb_r * 1.6
-            
-            start_x = bulb_cx + inner_r * math.cos(angle)
-            start_y = bulb_cy + inner_r * math.sin(angle)
-            end_x = bulb_cx + outer_r * math.cos(angle)
-            end_y = bulb_cy + outer_r * math.sin(angle)
-            
+        inner_r = bulb_r * 1.1
+        outer_r = bulb_r * 1.6
+        stroke_w = size / 60
+        for start_x, start_y, end_x, end_y in _ray_endpoints(bulb_cx, bulb_cy, inner_r, outer_r):
             ray = dwg.line(start=(start_x, start_y), end=(end_x, end_y), 
-                         stroke="url(#iconGradient)", stroke_width=size/60, 
+                         stroke="url(#iconGradient)", stroke_width=stroke_w, 
                          opacity=0.8, stroke_linecap="round")
             dwg.add(ray)
         
@@ -796,63 +946,92 @@ class AssetGenerator:
         dwg.add(wave1_path)
         dwg.add(bulb)
         
-        # Save the SVG
-        dwg.save()
+        return _drawing_bytes(dwg)
     
-    def _create_monochrome_svg_icon(self, input_svg: Path, output_path: Path) -> None:
+    def _create_monochrome_svg_icon(self, svg_bytes: bytes, output_path: Path) -> None:
         """Create a monochrome (single color) version of the SVG icon"""
-        # Read the input SVG
-        with open(input_svg, 'r') as file:
-            svg_content = file.read()
+        svg_content = svg_bytes.decode("utf-8")
         
         # Create a simple monochrome version by replacing colors with black
         monochrome_svg = svg_content.replace(BrandColors.DARK, '#000000')
         
         # Replace fill and stroke color references
-        import re
-        monochrome_svg = re.sub(r'fill="url\(#[^"]+\)"', 'fill="#000000"', monochrome_svg)
-        monochrome_svg = re.sub(r'stroke="url\(#[^"]+\)"', 'stroke="#000000"', monochrome_svg)
+        monochrome_svg = _RE_FILL_URL.sub('fill="#000000"', monochrome_svg)
+        monochrome_svg = _RE_STROKE_URL.sub('stroke="#000000"', monochrome_svg)
         
         # Remove filter attributes
-        monochrome_svg = re.sub(r'filter="[^"]+"', '', monochrome_svg)
+        monochrome_svg = _RE_FILTER_ATTR.sub('', monochrome_svg)
         
         # Remove gradient and filter definitions
-        monochrome_svg = re.sub(r'<linearGradient[^>]*>.*?</linearGradient>', '', 
-                               monochrome_svg, flags=re.DOTALL)
-        monochrome_svg = re.sub(r'<filter[^>]*>.*?</filter>', '', 
-                               monochrome_svg, flags=re.DOTALL)
+        monochrome_svg = _RE_LINEAR_GRAD.sub('', monochrome_svg)
+        monochrome_svg = _RE_FILTER_DEF.sub('', monochrome_svg)
         
         # Write the monochrome SVG
-        with open(output_path, 'w') as file:
-            file.write(monochrome_svg)
+        _write_if_changed(output_path, monochrome_svg.encode("utf-8"))
     
-    def _convert_svg_to_png(self, svg_path: Path, output_path: Path, size: int) -> None:
-        """Convert SVG to PNG at specified size"""
-        output_dir = output_path.parent
-        output_dir.mkdir(exist_ok=True, parents=True)
-        
-        # Use cairosvg for high-quality rendering
-        cairosvg.svg2png(url=str(svg_path), write_to=str(output_path), 
-                         output_width=size, output_height=size)
+    def _render_multisize(self, svg_bytes: bytes, sizes: List[int]) -> Dict[int, Image.Image]:
+        """Render an SVG at several square sizes, keyed by size
+        
+        The vector is rasterized once at the largest size and the smaller sizes
+        are Lanczos downscales of it; with --pixel-perfect every size is
+        rasterized from the vector instead.
+        """
+        # Renders are named by content, so a repeat within the run reuses the file
+        digest = hashlib.sha256(svg_bytes).hexdigest()[:16]
+        
+        # Resolved here: the lazy property is not safe to first touch from the workers
+        temp_dir = Path(self.temp_dir)
+        
+        def rasterize(size: int) -> Image.Image:
+            png_path = temp_dir / f"{digest}-{size}.png"
+            if not png_path.exists():
+                _convert_svg_to_png(svg_bytes, png_path, size)
+            image = Image.open(str(png_path))
+            image.load()
+            return image
+        
+        sizes = sorted(set(sizes), reverse=True)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            if PIXEL_PERFECT:
+                return dict(zip(sizes, executor.map(rasterize, sizes)))
+            
+            master = rasterize(sizes[0])
+            smaller = executor.map(lambda size: master.resize((size, size), Image.LANCZOS), sizes[1:])
+            return {sizes[0]: master, **dict(zip(sizes[1:], smaller))}
     
-    def _create_favicon(self, svg_path: Path, output_path: Path, sizes: List[int]) -> None:
-        """Create a multi-size favicon.ico file"""
-        # Generate PNG images at each size
-        png_files = []
-        
-        for size in sizes:
-            temp_png = Path(self.temp_dir) / f"favicon-{size}.png"
-            self._convert_svg_to_png(svg_path, temp_png, size)
-            png_files.append(temp_png)
-        
-        # Create an ICO file with all sizes
-        images = [Image.open(str(png_file)) for png_file in png_files]
-        
-        # Use the first image as base and save as ICO with all images
-        images[0].save(
-            str(output_path),
+    def _lazy_multisize(self, svg_bytes: bytes, 
+                        sizes: List[int]) -> Callable[[], Dict[int, Image.Image]]:
+        """Defer _render_multisize until an output actually needs the pixels"""
+        lock = threading.Lock()
+        images: Dict[int, Image.Image] = {}
+        
+        def render() -> Dict[int, Image.Image]:
+            with lock:
+                if not images:
+                    images.update(self._render_multisize(svg_bytes, sizes))
+            return images
+        return render
+    
+    @cached_asset(lambda self, svg_bytes, render, size, output_path: 
+                  (_multisize_key(svg_bytes, [size]), output_path))
+    def _save_app_icon(self, svg_bytes: bytes, render: Callable[[], Dict[int, Image.Image]], 
+                       size: int, output_path: Path) -> None:
+        """Write one size of the app icon as an optimized PNG"""
+        _save_image(render()[size], output_path, format="PNG", optimize=True)
+    
+    @cached_asset(lambda self, svg_bytes, render, sizes, output_path: 
+                  (_multisize_key(svg_bytes, sizes), output_path))
+    def _create_favicon(self, svg_bytes: bytes, render: Callable[[], Dict[int, Image.Image]], 
+                        sizes: List[int], output_path: Path) -> None:
+        """Create a multi-size favicon.ico file from the multi-size render"""
+        # The ICO writer drops sizes larger than the base image, so start from the largest
+        images = [render()[size] for size in sorted(sizes, reverse=True)]
+        
+        _save_image(
+            images[0], output_path,
             format='ICO', 
-            sizes=[(img.width, img.height) for img in images]
+            sizes=[(img.width, img.height) for img in images],
+            append_images=images[1:]
         )
     
     def update_manifest_json(self) -> None:
@@ -871,12 +1050,13 @@ class AssetGenerator:
             {"src": "assets/images/app-icon-512.png", "sizes": "512x512", "type": "image/png"}
         ]
         
-        # Create or update manifest.json
-        if manifest_path.exists():
+        # Create or update manifest.json, reusing what this generator last wrote
+        if self._last_manifest is not None:
+            manifest = dict(self._last_manifest)
+        elif manifest_path.exists():
             try:
-                with open(manifest_path, 'r') as file:
-                    manifest = json.load(file)
-            except:
+                manifest = json.loads(manifest_path.read_bytes())
+            except (OSError, ValueError):  # JSONDecodeError and UnicodeDecodeError
                 manifest = {}
         else:
             manifest = {}
@@ -906,9 +1086,11 @@ class AssetGenerator:
         # Update icons
         manifest["icons"] = icons
         
-        # Write updated manifest
-        with open(manifest_path, 'w') as file:
-            json.dump(manifest, file, indent=2)
+        # Write updated manifest, leaving the file untouched when nothing changed
+        self._last_manifest = manifest
+        if not _write_if_changed(manifest_path, _dump_json(manifest)):
+            console.print(f"✓ [cyan]{manifest_path}[/cyan] is already up to date")
+            return
         
         console.print(f"✓ Updated [cyan]{manifest_path}[/cyan] with icon references")
 
@@ -918,19 +1100,18 @@ def main():
     
     try:
         # Create asset generator
-        generator = AssetGenerator()
-        
-        # Generate logo
-        generator.generate_logo_svg(ICONS_DIR / "logo.svg")
-        
-        # Generate UI icons
-        generator.generate_ui_icons()
-        
-        # Generate app icons
-        generator.generate_app_icons()
-        
-        # Update manifest.json
-        generator.update_manifest_json()
+        with AssetGenerator() as generator:
+            # Generate logo
+            generator.generate_logo_svg(ICONS_DIR / "logo.svg")
+            
+            # Generate UI icons
+            generator.generate_ui_icons()
+            
+            # Generate app icons
+            generator.generate_app_icons()
+            
+            # Update manifest.json
+            generator.update_manifest_json()
         
         console.print("\n[bold green]✓ Asset generation complete![/bold green]")
         console.print(f"\nAssets have been generated in:")
@@ -938,8 +1119,13 @@ def main():
         console.print(f"  - [cyan]{IMAGES_DIR}[/cyan] (App icons and favicon)")
         
     except Exception as e:
-        console.print(f"\n[bold red]Error:[/bold red] {str(e)}", style="red")
         import traceback
+        if QUIET:
+            # Errors are still reported, just without rich formatting
+            print(f"Error: {e}", file=sys.stderr)
+            traceback.print_exc()
+            return 1
+        console.print(f"\n[bold red]Error:[/bold red] {str(e)}", style="red")
         console.print(traceback.format_exc(), style="dim")
         return 1
     